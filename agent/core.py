@@ -2,13 +2,22 @@
 Computer Use Agent - Core agent implementation.
 """
 
+import hashlib
 import json
+import os
+import sys
 import time
 import re
-from typing import Optional, List, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Optional, List, Dict, Any, Tuple
 
-from PIL import Image
+from PIL import Image, ImageChops
 
+# Add pydesktop to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydesktop import screen as _screen
 from .models import UIElement, Action, StepResult
 from .llm import BaseLLM
 from .omniparser import OmniParserClient
@@ -16,6 +25,40 @@ from .executor import ActionExecutor
 from .prompts import SYSTEM_PROMPT, SUMMARY_PROMPT
 
 
+# Response parsing patterns
+_REASON_RE = re.compile(r'Reason:\s*(.+?)(?=\nAction:|$)', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _scan_json_object(text: str, start: int = 0) -> Optional[Dict[str, Any]]:
+    """Decode the first JSON object in text at or after start, or None."""
+    brace = text.find("{", start)
+    while brace >= 0:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, brace)
+        except ValueError:
+            obj = None
+        if isinstance(obj, dict):
+            return obj
+        brace = text.find("{", brace + 1)
+    return None
+
+
+def _format_element(e: UIElement) -> str:
+    """Format a UI element as one prompt line, truncating long content."""
+    content = e.content if len(e.content) <= 50 else e.content[:50] + "..."
+    return f"Element {e.index}: type={e.type}, content=\"{content}\", center={e.center}"
+
+
+def _print_summary(future: "Future[str]"):
+    """Print a finished background summary, or why it failed."""
+    error = future.exception()
+    if error is not None:
+        print(f"Summary failed: {error}")
+    else:
+        print(f"Summary: {future.result()}")
+
+
 class ComputerUseAgent:
     """
     Vision-based computer automation agent.
@@ -23,8 +66,13 @@ class ComputerUseAgent:
     Similar to M3A but for desktop, using OmniParser for screen understanding.
     """
 
-    WAIT_AFTER_ACTION = 1.5  # seconds to wait after action
+    WAIT_AFTER_ACTION = 1.5  # max seconds to wait for the UI to settle after an action
+    SETTLE_MIN_WAIT = 0.2  # seconds before the first settle check
+    SETTLE_POLL_INTERVAL = 0.1  # seconds between settle checks
+    SETTLE_PIXEL_THRESHOLD = 16  # grayscale delta below which a pixel counts as unchanged
+    SETTLE_MAX_CHANGED_PIXELS = 500  # changed pixels tolerated (e.g. a blinking caret)
     MAX_STEPS = 50
+    SUMMARY_IMAGE_MAX_SIZE = 1024  # longest side of screenshots sent for summaries
 
     def __init__(
         self,
@@ -51,6 +99,7 @@ class ComputerUseAgent:
         self.screen = screen
         self.executor = ActionExecutor(screen=screen)
         self.additional_guidelines = additional_guidelines
+        self._system_prompt = SYSTEM_PROMPT.format(screen=screen)
 
         # Set user interaction callbacks
         self.executor.set_user_callbacks(
@@ -60,48 +109,98 @@ class ComputerUseAgent:
 
         self.history: List[Dict[str, Any]] = []
         self.goal: str = ""
+        self._history_lines: List[str] = []  # formatted prompt line per history entry
+
+        # Last OmniParser result, keyed by a hash of the parsed screenshot
+        self._last_parse_key: Optional[bytes] = None
+        self._last_parse: Optional[Tuple[Image.Image, List[UIElement]]] = None
+
+        # Summaries run in the background; they are only needed when the
+        # next step builds its history, so they overlap with its parse.
+        # Created on first use, so the agent can run again after close().
+        self._summary_executor: Optional[ThreadPoolExecutor] = None
 
     def reset(self):
         """Reset the agent state."""
         self.history = []
         self.goal = ""
+        self._history_lines = []
+        self._last_parse_key = None
+        self._last_parse = None
+
+    def close(self):
+        """Wait for pending summaries and release the background worker."""
+        if self._summary_executor is not None:
+            self._summary_executor.shutdown(wait=True)
+            self._summary_executor = None
+
+    def _get_summary_executor(self) -> ThreadPoolExecutor:
+        """Get the background summary worker, creating it if needed."""
+        if self._summary_executor is None:
+            self._summary_executor = ThreadPoolExecutor(max_workers=1)
+        return self._summary_executor
 
     def _get_screenshot(self) -> Image.Image:
         """Capture current screen."""
-        # Import here to avoid circular dependency
-        import sys
-        import os
-        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from pydesktop import screen
-        return screen.screenshot(screen=self.screen)
+        return _screen.screenshot(screen=self.screen)
+
+    def _parse_screen(self, screenshot: Image.Image) -> Tuple[Image.Image, List[UIElement]]:
+        """Parse a screenshot, reusing the previous result if the screen is unchanged."""
+        key = hashlib.blake2b(screenshot.tobytes(), digest_size=16).digest()
+        if key != self._last_parse_key:
+            self._last_parse = self.omniparser.parse(
+                screenshot, return_labeled_image=True
+            )
+            self._last_parse_key = key
+        return self._last_parse
+
+    def _frames_match(self, a: Image.Image, b: Image.Image) -> bool:
+        """Check whether two frames differ by no more than small noise."""
+        histogram = ImageChops.difference(a, b).convert("L").histogram()
+        changed = sum(histogram[self.SETTLE_PIXEL_THRESHOLD + 1:])
+        return changed <= self.SETTLE_MAX_CHANGED_PIXELS
+
+    def _wait_for_settle(self) -> Image.Image:
+        """
+        Wait until the screen stops changing, up to WAIT_AFTER_ACTION seconds.
+
+        Returns:
+            The last captured screenshot (the settled screen on success).
+        """
+        deadline = time.monotonic() + self.WAIT_AFTER_ACTION
+        time.sleep(self.SETTLE_MIN_WAIT)
+        previous = self._get_screenshot()
+
+        while time.monotonic() < deadline:
+            time.sleep(self.SETTLE_POLL_INTERVAL)
+            current = self._get_screenshot()
+            if self._frames_match(previous, current):
+                return current
+            previous = current
+
+        return previous
 
     def _build_prompt(self, ui_elements: List[UIElement]) -> str:
         """Build the action selection prompt."""
-        # Format history
-        if self.history:
-            history_parts = []
-            for i, step in enumerate(self.history):
-                part = f"Step {i+1}: {step['summary']}"
-                # Include user response if available (from ask_user action)
-                action = step.get('action')
-                if action and action.user_response:
-                    part += f" [User responded: {action.user_response}]"
-                history_parts.append(part)
-            history_str = "\n".join(history_parts)
+        # Format history (only entries added since the last prompt)
+        for i in range(len(self._history_lines), len(self.history)):
+            step = self.history[i]
+            part = f"Step {i+1}: {step['summary_future'].result()}"
+            # Include user response if available (from ask_user action)
+            action = step.get('action')
+            if action and action.user_response:
+                part += f" [User responded: {action.user_response}]"
+            self._history_lines.append(part)
+
+        if self._history_lines:
+            history_str = "\n".join(self._history_lines)
         else:
             history_str = "(No actions taken yet)"
 
         # Format UI elements
-        elements_str = "\n".join([
-            f"Element {e.index}: type={e.type}, content=\"{e.content[:50]}...\", center={e.center}"
-            if len(e.content) > 50 else
-            f"Element {e.index}: type={e.type}, content=\"{e.content}\", center={e.center}"
-            for e in ui_elements
-        ])
-
-        prompt = f"""{SYSTEM_PROMPT.format(screen=self.screen)}
+        elements_str = "\n".join(map(_format_element, ui_elements))
 
-CURRENT GOAL: {self.goal}
+        prompt = f"""CURRENT GOAL: {self.goal}
 
 HISTORY:
 {history_str}
@@ -119,24 +218,30 @@ Your Answer:
     def _parse_response(self, response: str) -> tuple[str, Action]:
         """Parse LLM response to extract reason and action."""
         # Extract reason
-        reason_match = re.search(r'Reason:\s*(.+?)(?=\nAction:|$)', response, re.DOTALL)
+        reason_match = _REASON_RE.search(response)
         reason = reason_match.group(1).strip() if reason_match else ""
 
-        # Extract action JSON
-        action_match = re.search(r'Action:\s*(\{.+?\})', response, re.DOTALL)
-        if not action_match:
-            # Try to find any JSON in the response
-            json_match = re.search(r'\{[^{}]+\}', response)
-            if json_match:
-                action_dict = json.loads(json_match.group())
-            else:
-                raise ValueError(f"Could not find action JSON in response: {response}")
-        else:
-            action_dict = json.loads(action_match.group(1))
+        # Extract action JSON (first object after "Action:", else any object)
+        action_dict = None
+        action_idx = response.find("Action:")
+        if action_idx >= 0:
+            action_dict = _scan_json_object(response, action_idx)
+        if action_dict is None:
+            action_dict = _scan_json_object(response)
+        if action_dict is None:
+            raise ValueError(f"Could not find action JSON in response: {response}")
 
         action = Action.from_dict(action_dict)
         return reason, action
 
+    def _downscale(self, image: Image.Image) -> Image.Image:
+        """Shrink an image so its longest side fits SUMMARY_IMAGE_MAX_SIZE."""
+        scale = self.SUMMARY_IMAGE_MAX_SIZE / max(image.size)
+        if scale >= 1:
+            return image
+        size = (round(image.width * scale), round(image.height * scale))
+        return image.resize(size, Image.BILINEAR)
+
     def _generate_summary(
         self,
         before_img: Image.Image,
@@ -146,11 +251,12 @@ Your Answer:
     ) -> str:
         """Generate a summary of the step."""
         prompt = SUMMARY_PROMPT.format(
-            action=json.dumps(action.__dict__),
+            action=json.dumps(asdict(action)),
             reason=reason,
         )
 
-        summary, _ = self.llm.predict(prompt, images=[before_img, after_img])
+        images = [self._downscale(before_img), self._downscale(after_img)]
+        summary, _ = self.llm.predict(prompt, images=images)
         return summary.strip()
 
     def step(self, goal: str) -> StepResult:
@@ -159,11 +265,13 @@ Your Answer:
 
         # 1. Capture screenshot and parse UI
         before_screenshot = self._get_screenshot()
-        labeled_img, ui_elements = self.omniparser.parse(before_screenshot)
+        labeled_img, ui_elements = self._parse_screen(before_screenshot)
 
         # 2. Build prompt and call LLM
         prompt = self._build_prompt(ui_elements)
-        response, raw = self.llm.predict(prompt, images=[labeled_img])
+        response, raw = self.llm.predict(
+            prompt, images=[labeled_img], system_prompt=self._system_prompt
+        )
 
         # 3. Parse response
         reason, action = self._parse_response(response)
@@ -173,21 +281,21 @@ Your Answer:
         # 4. Execute action
         is_terminal = not self.executor.execute(action, ui_elements)
 
-        # 5. Wait and capture after screenshot
-        time.sleep(self.WAIT_AFTER_ACTION)
-        after_screenshot = self._get_screenshot()
+        # 5. Wait for the UI to settle and capture after screenshot
+        after_screenshot = self._wait_for_settle()
 
-        # 6. Generate summary
-        summary = self._generate_summary(before_screenshot, after_screenshot, action, reason)
-        print(f"Summary: {summary}")
+        # 6. Generate summary in the background
+        summary_future = self._get_summary_executor().submit(
+            self._generate_summary, before_screenshot, after_screenshot, action, reason
+        )
+        summary_future.add_done_callback(_print_summary)
 
-        # 7. Record to history
+        # 7. Record to history (screenshots are not kept; prompts only need
+        # the summary, and full frames would pile up over a long run)
         step_data = {
             "action": action,
             "reason": reason,
-            "summary": summary,
-            "before_screenshot": before_screenshot,
-            "after_screenshot": after_screenshot,
+            "summary_future": summary_future,
         }
         self.history.append(step_data)
 
@@ -197,16 +305,22 @@ Your Answer:
         return StepResult(
             action=action,
             reason=reason,
-            summary=summary,
+            summary=None,
             before_screenshot=before_screenshot,
             after_screenshot=after_screenshot,
             ui_elements=ui_elements,
             done=done,
             raw_response=response,
+            summary_future=summary_future,
         )
 
     def run(self, goal: str, max_steps: Optional[int] = None) -> List[StepResult]:
-        """Run the agent until completion or max steps."""
+        """
+        Run the agent until completion or max steps.
+
+        Only the last result keeps its before/after screenshots; earlier
+        results have them cleared to bound memory over long runs.
+        """
         self.reset()
         max_steps = max_steps or self.MAX_STEPS
         results = []
@@ -220,6 +334,11 @@ Your Answer:
 
             try:
                 result = self.step(goal)
+                if results:
+                    # Keep full-resolution frames only on the latest result so
+                    # a long run does not hold every screenshot in memory
+                    results[-1].before_screenshot = None
+                    results[-1].after_screenshot = None
                 results.append(result)
 
                 if result.done:
@@ -5,7 +5,7 @@ Action Executor - Execute actions using pydesktop.
 import time
 import sys
 import os
-from typing import List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable
 
 # Add pydesktop to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,6 +26,24 @@ class ActionExecutor:
         self.ask_user_callback: Optional[Callable[[str], str]] = None
         self.talk_to_user_callback: Optional[Callable[[str], None]] = None
 
+        # action_type -> handler
+        self._handlers: Dict[str, Callable[[Action, List[UIElement], int], bool]] = {
+            "status": self._do_status,
+            "answer": self._do_answer,
+            "talk_to_user": self._do_talk_to_user,
+            "ask_user": self._do_ask_user,
+            "wait": self._do_wait,
+            "click": self._do_click,
+            "double_click": self._do_double_click,
+            "right_click": self._do_right_click,
+            "input_text": self._do_input_text,
+            "type": self._do_type,
+            "press_key": self._do_press_key,
+            "hotkey": self._do_hotkey,
+            "scroll": self._do_scroll,
+            "drag": self._do_drag,
+        }
+
     def set_user_callbacks(
         self,
         ask_user: Optional[Callable[[str], str]] = None,
@@ -51,92 +69,101 @@ class ActionExecutor:
         Returns:
             True if action was executed, False if it's a terminal action
         """
-        action_type = action.action_type
-
-        if action_type == "status":
-            return False  # Terminal action
-
-        if action_type == "answer":
-            print(f"Agent answer: {action.text}")
-            if self.talk_to_user_callback:
-                self.talk_to_user_callback(action.text)
-            return False  # Terminal action
-
-        if action_type == "talk_to_user":
-            print(f"Agent message: {action.text}")
-            if self.talk_to_user_callback:
-                self.talk_to_user_callback(action.text)
-            return True  # Continue after showing message
-
-        if action_type == "ask_user":
-            question = action.question or "Agent needs input"
-            print(f"Agent asks: {question}")
-            if self.ask_user_callback:
-                response = self.ask_user_callback(question)
-                action.user_response = response
-                print(f"User response: {response}")
-            return True  # Continue after getting response
-
-        if action_type == "wait":
-            time.sleep(self.WAIT_SECONDS)
-            return True
-
-        screen = self._get_screen(action)
-
-        if action_type == "click":
+        handler = self._handlers.get(action.action_type, self._do_unknown)
+        return handler(action, ui_elements, self._get_screen(action))
+
+    # Action handlers: return False for terminal actions; screen is already resolved
+
+    def _do_status(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        return False  # Terminal action
+
+    def _do_answer(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        print(f"Agent answer: {action.text}")
+        if self.talk_to_user_callback:
+            self.talk_to_user_callback(action.text)
+        return False  # Terminal action
+
+    def _do_talk_to_user(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        print(f"Agent message: {action.text}")
+        if self.talk_to_user_callback:
+            self.talk_to_user_callback(action.text)
+        return True  # Continue after showing message
+
+    def _do_ask_user(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        question = action.question or "Agent needs input"
+        print(f"Agent asks: {question}")
+        if self.ask_user_callback:
+            response = self.ask_user_callback(question)
+            action.user_response = response
+            print(f"User response: {response}")
+        return True  # Continue after getting response
+
+    def _do_wait(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        time.sleep(self.WAIT_SECONDS)
+        return True
+
+    def _do_click(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        x, y = self._get_coords(action, ui_elements)
+        mouse.click_at(x, y, screen=screen)
+        return True
+
+    def _do_double_click(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        x, y = self._get_coords(action, ui_elements)
+        mouse.double_click_at(x, y, screen=screen)
+        return True
+
+    def _do_right_click(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        x, y = self._get_coords(action, ui_elements)
+        mouse.right_click_at(x, y, screen=screen)
+        return True
+
+    def _do_input_text(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        # Click on element first, then type
+        if action.index is not None:
             x, y = self._get_coords(action, ui_elements)
             mouse.click_at(x, y, screen=screen)
+            time.sleep(0.3)
+        keyboard.type_text(action.text)
+        return True
 
-        elif action_type == "double_click":
-            x, y = self._get_coords(action, ui_elements)
-            mouse.double_click_at(x, y, screen=screen)
+    def _do_type(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        keyboard.type_text(action.text)
+        return True
 
-        elif action_type == "right_click":
-            x, y = self._get_coords(action, ui_elements)
-            mouse.right_click_at(x, y, screen=screen)
-
-        elif action_type == "input_text":
-            # Click on element first, then type
-            if action.index is not None:
-                x, y = self._get_coords(action, ui_elements)
-                mouse.click_at(x, y, screen=screen)
-                time.sleep(0.3)
-            keyboard.type_text(action.text)
-
-        elif action_type == "type":
-            keyboard.type_text(action.text)
-
-        elif action_type == "press_key":
-            keyboard.press(action.key)
-
-        elif action_type == "hotkey":
-            keyboard.hotkey(*action.keys)
-
-        elif action_type == "scroll":
-            direction = action.direction.lower()
-
-            # Move to element if specified
-            if action.index is not None:
-                x, y = self._get_coords(action, ui_elements)
-                mouse.move_to(x, y, screen=screen)
-
-            if direction == "up":
-                mouse.scroll_up(self.SCROLL_AMOUNT)
-            elif direction == "down":
-                mouse.scroll_down(self.SCROLL_AMOUNT)
-            elif direction == "left":
-                mouse.scroll(dx=-self.SCROLL_AMOUNT, dy=0)
-            elif direction == "right":
-                mouse.scroll(dx=self.SCROLL_AMOUNT, dy=0)
-
-        elif action_type == "drag":
+    def _do_press_key(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        keyboard.press(action.key)
+        return True
+
+    def _do_hotkey(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        keyboard.hotkey(*action.keys)
+        return True
+
+    def _do_scroll(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        direction = action.direction.lower()
+
+        # Move to element if specified
+        if action.index is not None:
             x, y = self._get_coords(action, ui_elements)
             mouse.move_to(x, y, screen=screen)
-            mouse.drag_to(action.x, action.y, duration=0.5, screen=screen)
 
-        else:
-            print(f"Unknown action type: {action_type}")
+        if direction == "up":
+            mouse.scroll_up(self.SCROLL_AMOUNT)
+        elif direction == "down":
+            mouse.scroll_down(self.SCROLL_AMOUNT)
+        elif direction == "left":
+            mouse.scroll(dx=-self.SCROLL_AMOUNT, dy=0)
+        elif direction == "right":
+            mouse.scroll(dx=self.SCROLL_AMOUNT, dy=0)
+        return True
+
+    def _do_drag(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        x, y = self._get_coords(action, ui_elements)
+        mouse.move_to(x, y, screen=screen)
+        mouse.drag_to(action.x, action.y, duration=0.5, screen=screen)
+        return True
 
+    def _do_unknown(self, action: Action, ui_elements: List[UIElement], screen: int) -> bool:
+        print(f"Unknown action type: {action.action_type}")
         return True
 
     def _get_coords(self, action: Action, ui_elements: List[UIElement]) -> Tuple[int, int]:
@@ -8,9 +8,12 @@ A simple GUI for running the agent with settings management.
 import sys
 import os
 import json
+import queue
 import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -18,7 +21,7 @@ from PyQt5.QtWidgets import (
     QSpinBox, QMessageBox, QFrame, QSplitter, QGroupBox,
     QSystemTrayIcon, QMenu, QAction, QInputDialog,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QMetaObject, Q_ARG, Qt as QtCore
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal, pyqtSlot, QSize, QMetaObject, Q_ARG, Qt as QtCore
 from PyQt5.QtGui import QFont, QIcon, QTextCursor, QPixmap
 
 # Add parent to path
@@ -29,6 +32,7 @@ from agent import (
     OpenAICompatibleLLM,
     OmniParserClient,
 )
+from pydesktop import screen as _screen
 
 
 # =============================================================================
@@ -58,6 +62,7 @@ DEFAULT_CONFIG = {
     "omniparser_url": "",  # Empty = local mode
     "max_steps": 20,
     "screen": 0,  # Screen index (0=primary, 1+=others)
+    "debug_console": True,  # Echo agent log lines to stdout
 }
 
 
@@ -88,7 +93,6 @@ def save_config(config: dict):
 class AgentWorker(QThread):
     """Worker thread for running the agent."""
 
-    log_signal = pyqtSignal(str)  # Emit log messages
     finished_signal = pyqtSignal(bool, str)  # Emit (success, message)
     ask_user_signal = pyqtSignal(str)  # Emit question to ask user
     talk_to_user_signal = pyqtSignal(str)  # Emit message to show user
@@ -99,6 +103,9 @@ class AgentWorker(QThread):
         self.config = config
         self._stop_flag = False
 
+        # Log lines, drained in batches by the GUI thread (see MainWindow.flush_logs)
+        self._log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
         # For user interaction
         self._user_response: Optional[str] = None
         self._response_event = threading.Event()
@@ -110,8 +117,26 @@ class AgentWorker(QThread):
         self._response_event.set()
 
     def log(self, message: str):
-        """Emit a log message."""
-        self.log_signal.emit(message)
+        """Queue a log message for the GUI."""
+        self._log_queue.put(message)
+
+    def _log_summary(self, future: "Future[str]"):
+        """Log a finished background summary, or why it failed."""
+        error = future.exception()
+        if error is not None:
+            self.log(f"Summary failed: {error}")
+        else:
+            self.log(f"Summary: {future.result()}")
+
+    def take_logs(self) -> List[str]:
+        """Take all queued log messages."""
+        messages = []
+        try:
+            while True:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return messages
 
     def set_user_response(self, response: str):
         """Set the user's response (called from main thread)."""
@@ -132,7 +157,14 @@ class AgentWorker(QThread):
         self.talk_to_user_signal.emit(message)
 
     def run(self):
-        """Run the agent."""
+        """Run the agent and report the outcome once it has fully shut down."""
+        success, message = self._run_agent()
+        self.finished_signal.emit(success, message)
+
+    def _run_agent(self) -> Tuple[bool, str]:
+        """Run the agent loop, returning (success, message)."""
+        agent = None
+        llm = None
         try:
             self.log(f"Goal: {self.goal}")
             self.log("-" * 50)
@@ -149,16 +181,14 @@ class AgentWorker(QThread):
             omniparser_url = self.config.get("omniparser_url", "").strip()
             if not omniparser_url:
                 self.log("Error: OmniParser URL not configured")
-                self.finished_signal.emit(False, "OmniParser URL not set")
-                return
+                return False, "OmniParser URL not set"
 
             self.log(f"Connecting to OmniParser: {omniparser_url}")
             omniparser = OmniParserClient(server_url=omniparser_url)
 
             if not omniparser.is_available():
                 self.log("Error: OmniParser server not available")
-                self.finished_signal.emit(False, "OmniParser server unavailable")
-                return
+                return False, "OmniParser server unavailable"
 
             # Create agent
             screen_idx = self.config.get("screen", 0)
@@ -181,8 +211,7 @@ class AgentWorker(QThread):
             for step_num in range(max_steps):
                 if self._stop_flag:
                     self.log("\n[Stopped by user]")
-                    self.finished_signal.emit(False, "Stopped by user")
-                    return
+                    return False, "Stopped by user"
 
                 self.log(f"\n--- Step {step_num + 1} ---")
 
@@ -191,25 +220,32 @@ class AgentWorker(QThread):
 
                     self.log(f"Reason: {result.reason}")
                     self.log(f"Action: {result.action.action_type}")
-                    self.log(f"Summary: {result.summary}")
+                    result.summary_future.add_done_callback(self._log_summary)
 
                     if result.done:
                         status = result.action.goal_status or "completed"
                         self.log(f"\n{'=' * 50}")
                         self.log(f"Task {status} after {step_num + 1} steps")
-                        self.finished_signal.emit(True, f"Task {status}")
-                        return
+                        return True, f"Task {status}"
 
                 except Exception as e:
                     self.log(f"Error: {e}")
                     raise
 
             self.log(f"\nMax steps ({max_steps}) reached")
-            self.finished_signal.emit(False, "Max steps reached")
+            return False, "Max steps reached"
 
         except Exception as e:
             self.log(f"\nError: {e}")
-            self.finished_signal.emit(False, str(e))
+            return False, str(e)
+        finally:
+            # Waits for the last step's summary, so it is logged before finishing
+            if agent is not None:
+                agent.close()
+            if llm is not None:
+                llm.close()
+            # Each run gets a new thread; don't leave its capture handle open
+            _screen.release_thread_resources()
 
 
 # =============================================================================
@@ -303,6 +339,7 @@ class SettingsDialog(QDialog):
             "omniparser_url": self.parser_url_edit.text().strip(),
             "max_steps": self.max_steps_spin.value(),
             "screen": self.screen_spin.value(),
+            "debug_console": self.config.get("debug_console", True),
         }
 
 
@@ -324,11 +361,11 @@ class AgentMessageDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Message label
-        msg_label = QLabel(message)
-        msg_label.setWordWrap(True)
-        msg_label.setFont(QFont("Sans", 11))
-        msg_label.setStyleSheet("padding: 10px;")
-        layout.addWidget(msg_label)
+        self.msg_label = QLabel(message)
+        self.msg_label.setWordWrap(True)
+        self.msg_label.setFont(QFont("Sans", 11))
+        self.msg_label.setStyleSheet("padding: 10px;")
+        layout.addWidget(self.msg_label)
 
         # OK button
         ok_btn = QPushButton("OK")
@@ -336,6 +373,11 @@ class AgentMessageDialog(QDialog):
         ok_btn.setMinimumHeight(30)
         layout.addWidget(ok_btn)
 
+    def set_message(self, message: str):
+        """Replace the displayed message (lets the dialog be reused)."""
+        self.msg_label.setText(message)
+        self.adjustSize()
+
 
 # =============================================================================
 # Log Viewer Dialog
@@ -380,15 +422,29 @@ class LogViewerDialog(QDialog):
 # Main Window
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _tray_icon() -> QIcon:
+    """Tray icon (a blue square), built once after QApplication exists."""
+    pixmap = QPixmap(32, 32)
+    pixmap.fill(Qt.blue)
+    return QIcon(pixmap)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    LOG_FLUSH_INTERVAL_MS = 50
+
     def __init__(self):
         super().__init__()
         self.config = load_config()
         self.worker: Optional[AgentWorker] = None
-        self.log_text = ""
+        self.log_lines: List[str] = []
+        # User interaction dialogs, built on first use and then reused
+        self._ask_dialog: Optional[QInputDialog] = None
+        self._msg_dialog: Optional[AgentMessageDialog] = None
         self.setup_ui()
+        self.setup_log_timer()
         self.setup_tray()
 
     def setup_ui(self):
@@ -456,13 +512,15 @@ class MainWindow(QMainWindow):
         # Stretch to push everything up
         layout.addStretch()
 
+    def setup_log_timer(self):
+        """Poll the worker's log queue so bursts of lines cost one GUI wakeup."""
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self.log_timer.timeout.connect(self.flush_logs)
+
     def setup_tray(self):
         """Setup system tray icon."""
-        # Create a simple icon (blue square)
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.blue)
-
-        self.tray_icon = QSystemTrayIcon(QIcon(pixmap), self)
+        self.tray_icon = QSystemTrayIcon(_tray_icon(), self)
         self.tray_icon.setToolTip("Computer Use Agent")
 
         # Tray menu
@@ -525,7 +583,7 @@ class MainWindow(QMainWindow):
             return
 
         # Clear log
-        self.log_text = ""
+        self.log_lines.clear()
 
         # Update UI
         self.start_btn.setEnabled(False)
@@ -543,11 +601,12 @@ class MainWindow(QMainWindow):
 
         # Start worker
         self.worker = AgentWorker(goal, self.config)
-        self.worker.log_signal.connect(self.on_log)
-        self.worker.finished_signal.connect(self.on_finished)
-        self.worker.ask_user_signal.connect(self.on_ask_user)
-        self.worker.talk_to_user_signal.connect(self.on_talk_to_user)
+        # Worker signals are emitted from the agent thread; queue them explicitly
+        self.worker.finished_signal.connect(self.on_finished, Qt.QueuedConnection)
+        self.worker.ask_user_signal.connect(self.on_ask_user, Qt.QueuedConnection)
+        self.worker.talk_to_user_signal.connect(self.on_talk_to_user, Qt.QueuedConnection)
         self.worker.start()
+        self.log_timer.start()
 
     def stop_agent(self):
         """Stop the agent."""
@@ -555,56 +614,75 @@ class MainWindow(QMainWindow):
             self.worker.stop()
             self.status_label.setText("Stopping...")
 
-    def on_log(self, message: str):
-        """Handle log messages."""
-        self.log_text += message + "\n"
-        print(message)  # Also print to console
-
+    def flush_logs(self):
+        """Move queued worker log messages into the log (and console) in one batch."""
+        if not self.worker:
+            return
+        messages = self.worker.take_logs()
+        if messages:
+            self.log_lines.extend(messages)
+            # Console output is optional; a slow console must not stall the GUI
+            if self.config.get("debug_console", True):
+                sys.stdout.write("\n".join(messages) + "\n")
+
+    def _exec_dialog(self, dialog: QDialog) -> int:
+        """Run a dialog modally on top, leaving the (hidden) main window unmapped."""
+        dialog.show()
+        dialog.activateWindow()
+        dialog.raise_()
+        return dialog.exec_()
+
+    @pyqtSlot(str)
     def on_ask_user(self, question: str):
         """Handle ask_user from agent - show input dialog."""
-        # Show window temporarily for user interaction
-        self.show()
-        self.activateWindow()
-        self.raise_()
+        self.flush_logs()  # Keep earlier worker lines ahead of this exchange
+
+        if self._ask_dialog is None:
+            self._ask_dialog = QInputDialog(self)
+            self._ask_dialog.setWindowTitle("Agent Question")
+            self._ask_dialog.setInputMode(QInputDialog.TextInput)
+            self._ask_dialog.setWindowFlags(
+                self._ask_dialog.windowFlags() | Qt.WindowStaysOnTopHint
+            )
+        self._ask_dialog.setLabelText(question)
+        self._ask_dialog.setTextValue("")
 
-        response, ok = QInputDialog.getText(
-            self,
-            "Agent Question",
-            question,
-            QLineEdit.Normal,
-            ""
-        )
+        ok = self._exec_dialog(self._ask_dialog) == QDialog.Accepted
+        response = self._ask_dialog.textValue()
 
         if ok:
-            self.log_text += f"Agent asked: {question}\n"
-            self.log_text += f"User response: {response}\n"
+            self.log_lines.append(f"Agent asked: {question}")
+            self.log_lines.append(f"User response: {response}")
         else:
             response = ""
-            self.log_text += f"Agent asked: {question}\n"
-            self.log_text += "User cancelled\n"
+            self.log_lines.append(f"Agent asked: {question}")
+            self.log_lines.append("User cancelled")
 
-        # Hide window again and send response
-        self.hide()
         if self.worker:
             self.worker.set_user_response(response)
 
+    @pyqtSlot(str)
     def on_talk_to_user(self, message: str):
         """Handle talk_to_user from agent - show message dialog."""
-        # Show window temporarily for user interaction
-        self.show()
-        self.activateWindow()
-        self.raise_()
+        self.flush_logs()  # Keep earlier worker lines ahead of this exchange
 
-        self.log_text += f"Agent message: {message}\n"
+        self.log_lines.append(f"Agent message: {message}")
 
-        dialog = AgentMessageDialog(message, self)
-        dialog.exec_()
-
-        # Hide window again
-        self.hide()
+        if self._msg_dialog is None:
+            self._msg_dialog = AgentMessageDialog(message, self)
+            self._msg_dialog.setWindowFlags(
+                self._msg_dialog.windowFlags() | Qt.WindowStaysOnTopHint
+            )
+        else:
+            self._msg_dialog.set_message(message)
+        self._exec_dialog(self._msg_dialog)
 
+    @pyqtSlot(bool, str)
     def on_finished(self, success: bool, message: str):
         """Handle agent completion."""
+        self.log_timer.stop()
+        self.flush_logs()
+
         # Show window again
         self.show()
         self.activateWindow()
@@ -636,7 +714,8 @@ class MainWindow(QMainWindow):
 
     def show_log(self):
         """Show log viewer."""
-        dialog = LogViewerDialog(self.log_text or "(No logs yet)", self)
+        log_text = "\n".join(self.log_lines) + "\n" if self.log_lines else "(No logs yet)"
+        dialog = LogViewerDialog(log_text, self)
         dialog.exec_()
 
     def closeEvent(self, event):
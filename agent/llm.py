@@ -3,8 +3,12 @@ LLM Integration - Abstract base and implementations.
 """
 
 import base64
+import hashlib
 import io
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple, Any
 
 from PIL import Image
@@ -17,7 +21,8 @@ class BaseLLM(ABC):
     def predict(
         self,
         prompt: str,
-        images: Optional[List[Image.Image]] = None
+        images: Optional[List[Image.Image]] = None,
+        system_prompt: Optional[str] = None,
     ) -> Tuple[str, Any]:
         """
         Call the LLM with a prompt and optional images.
@@ -25,27 +30,53 @@ class BaseLLM(ABC):
         Args:
             prompt: Text prompt
             images: Optional list of PIL images
+            system_prompt: Optional system message sent ahead of the prompt
 
         Returns:
             Tuple of (response_text, raw_response)
         """
         pass
 
+    def close(self):
+        """Release any resources held by the client."""
+        pass
+
 
 class OpenAICompatibleLLM(BaseLLM):
     """LLM client compatible with OpenAI API format."""
 
+    B64_CACHE_SIZE = 8  # encoded images kept for re-sends
+
     def __init__(
         self,
         base_url: str,
         api_key: str,
         model: str = "gpt-4o",
         max_tokens: int = 4096,
+        image_format: str = "JPEG",
+        jpeg_quality: int = 85,
+        max_image_size: Optional[int] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
+        self.image_format = image_format.upper()
+        self.jpeg_quality = jpeg_quality
+        # Longest image side sent to the model (None = no limit). Off by
+        # default: the agent's prompt asks for raw x/y screen coordinates
+        # (coordinate clicks, drag targets), which are only right when the
+        # model sees the screenshot at full size
+        self.max_image_size = max_image_size
+        self._data_url_prefix = f"data:image/{self.image_format.lower()};base64,"
+        # PIL releases the GIL while encoding, so multi-image requests
+        # (e.g. before/after summaries) encode their images in parallel.
+        # Created on first use and released by close().
+        self._encode_executor: Optional[ThreadPoolExecutor] = None
+        # Recently encoded images, keyed by a hash of their pixels, so an
+        # unchanged screen is not re-encoded
+        self._b64_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._b64_cache_lock = threading.Lock()
 
         try:
             from openai import OpenAI
@@ -53,35 +84,77 @@ class OpenAICompatibleLLM(BaseLLM):
         except ImportError:
             raise ImportError("openai package required. Install with: pip install openai")
 
+    def close(self):
+        """Shut down the image encoding workers."""
+        if self._encode_executor is not None:
+            self._encode_executor.shutdown(wait=True)
+            self._encode_executor = None
+
     def _image_to_base64(self, image: Image.Image) -> str:
-        """Convert PIL image to base64 string."""
+        """Convert PIL image to base64 string (cached by pixel content)."""
+        hasher = hashlib.blake2b(image.tobytes(), digest_size=16)
+        hasher.update(f"{image.mode}{image.size}".encode())
+        key = hasher.digest()
+        with self._b64_cache_lock:
+            b64 = self._b64_cache.get(key)
+            if b64 is not None:
+                self._b64_cache.move_to_end(key)
+                return b64
+
+        if self.max_image_size and max(image.size) > self.max_image_size:
+            scale = self.max_image_size / max(image.size)
+            size = (round(image.width * scale), round(image.height * scale))
+            image = image.resize(size, Image.LANCZOS)
+
         buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+        if self.image_format == "JPEG":
+            image.convert("RGB").save(buffer, format="JPEG", quality=self.jpeg_quality)
+        else:
+            image.save(buffer, format=self.image_format)
+        b64 = base64.b64encode(buffer.getbuffer()).decode("ascii")
+
+        with self._b64_cache_lock:
+            self._b64_cache[key] = b64
+            if len(self._b64_cache) > self.B64_CACHE_SIZE:
+                self._b64_cache.popitem(last=False)
+        return b64
 
     def predict(
         self,
         prompt: str,
-        images: Optional[List[Image.Image]] = None
+        images: Optional[List[Image.Image]] = None,
+        system_prompt: Optional[str] = None,
     ) -> Tuple[str, Any]:
         """Call the LLM."""
         content = []
 
         # Add images first
         if images:
-            for img in images:
-                b64 = self._image_to_base64(img)
+            if len(images) > 1:
+                if self._encode_executor is None:
+                    self._encode_executor = ThreadPoolExecutor(max_workers=2)
+                encoded = self._encode_executor.map(self._image_to_base64, images)
+            else:
+                encoded = [self._image_to_base64(images[0])]
+            for b64 in encoded:
                 content.append({
                     "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{b64}"}
+                    "image_url": {"url": self._data_url_prefix + b64}
                 })
 
         # Add text prompt
         content.append({"type": "text", "text": prompt})
 
+        # A constant system message keeps the request prefix identical across
+        # steps, so endpoints with prompt caching can reuse it
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": content})
+
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[{"role": "user", "content": content}],
+            messages=messages,
             max_tokens=self.max_tokens,
         )
 
@@ -2,13 +2,14 @@
 Data Models - Data structures used by the agent.
 """
 
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, fields
 from typing import Optional, List, Dict, Any, Tuple
 
 from PIL import Image
 
 
-@dataclass
+@dataclass(slots=True)
 class UIElement:
     """Represents a UI element detected by OmniParser."""
     index: int
@@ -29,7 +30,7 @@ class UIElement:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """Represents an action to be executed."""
     action_type: str
@@ -47,30 +48,32 @@ class Action:
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "Action":
-        return cls(
-            action_type=d.get("action_type"),
-            index=d.get("index"),
-            x=d.get("x"),
-            y=d.get("y"),
-            text=d.get("text"),
-            direction=d.get("direction"),
-            key=d.get("key"),
-            keys=d.get("keys"),
-            goal_status=d.get("goal_status"),
-            question=d.get("question"),
-            user_response=d.get("user_response"),
-            screen=d.get("screen"),
-        )
+        return cls(**{name: d.get(name) for name in _ACTION_FIELDS})
 
 
-@dataclass
+# Action field names, read once so from_dict tracks the dataclass definition
+_ACTION_FIELDS = tuple(f.name for f in fields(Action))
+
+
+@dataclass(slots=True)
 class StepResult:
     """Result of a single agent step."""
     action: Action
     reason: str
-    summary: str
-    before_screenshot: Image.Image
-    after_screenshot: Image.Image
+    summary: Optional[str]  # None while a background summary is pending
+    before_screenshot: Optional[Image.Image]  # None once run() moves past this step
+    after_screenshot: Optional[Image.Image]
     ui_elements: List[UIElement]
     done: bool = False
     raw_response: str = ""
+    summary_future: Optional["Future[str]"] = None  # background summary call, if any
+
+    def wait_summary(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Get the step summary, waiting for the background summary if needed.
+
+        Raises the summary call's exception if it failed.
+        """
+        if self.summary is None and self.summary_future is not None:
+            self.summary = self.summary_future.result(timeout)
+        return self.summary
@@ -4,22 +4,43 @@ OmniParser Client - Remote API client for OmniParser server.
 
 import base64
 import io
-from typing import List, Tuple, Dict, Any
+import json
+import time
+from operator import itemgetter
+from typing import List, Tuple, Dict, Any, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 
 from .models import UIElement
 
 
+# Element fields in UIElement positional order
+_ELEMENT_FIELDS = itemgetter("index", "type", "content", "bbox", "center", "is_clickable")
+
+
 class OmniParserClient:
     """OmniParser client that connects to a remote server."""
 
+    HEALTH_TTL = 10.0  # seconds a healthy check is trusted by is_available()
+
     def __init__(
         self,
         server_url: str = "http://localhost:8000",
         use_paddleocr: bool = True,
         timeout: int = 60,
+        image_format: str = "JPEG",
+        jpeg_quality: int = 85,
+        use_binary_upload: bool = True,
+        labeled_image_format: str = "JPEG",
     ):
         """
         Initialize OmniParser client.
@@ -28,28 +49,77 @@ class OmniParserClient:
             server_url: URL of the OmniParser server
             use_paddleocr: Whether to use PaddleOCR (vs EasyOCR)
             timeout: Request timeout in seconds
+            image_format: Upload encoding ("JPEG" is much faster than "PNG")
+            jpeg_quality: JPEG quality when image_format is "JPEG"
+            use_binary_upload: Upload raw image bytes as multipart/form-data
+                (/parse_upload) instead of base64 JSON (/parse)
+            labeled_image_format: Format the server returns the labeled image in
+                ("JPEG" avoids PNG's zlib cost on both ends; it is re-encoded
+                for the LLM anyway)
         """
         self.server_url = server_url.rstrip("/")
+        self._health_url = f"{self.server_url}/health"
+        self._parse_url = f"{self.server_url}/parse"
+        self._parse_upload_url = f"{self.server_url}/parse_upload"
         self.use_paddleocr = use_paddleocr
         self.timeout = timeout
+        self.image_format = image_format.upper()
+        self.jpeg_quality = jpeg_quality
+        self.use_binary_upload = use_binary_upload
+        self.labeled_image_format = labeled_image_format.upper()
+        self._last_healthy_at: Optional[float] = None
+
+        # Keep-alive connection pool shared by all requests to the server.
+        # Only failed connections are retried (the request never reached the
+        # server); a read timeout on /parse is not, since the server would
+        # queue the duplicate parse behind the one still running.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.2),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def _encode_image(self, image: Image.Image) -> io.BytesIO:
+        """Encode PIL image in the configured upload format."""
+        buffer = io.BytesIO()
+        if self.image_format == "JPEG":
+            image.convert("RGB").save(buffer, format="JPEG", quality=self.jpeg_quality)
+        else:
+            image.save(buffer, format=self.image_format)
+        return buffer
+
+    def _image_to_bytes(self, image: Image.Image) -> bytes:
+        """Convert PIL image to encoded bytes."""
+        return self._encode_image(image).getvalue()
 
     def _image_to_base64(self, image: Image.Image) -> str:
         """Convert PIL image to base64 string."""
-        buffer = io.BytesIO()
-        image.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+        # getbuffer() exposes the encoded bytes without copying them out
+        return base64.b64encode(self._encode_image(image).getbuffer()).decode("ascii")
 
     def health_check(self) -> Dict[str, Any]:
         """Check if the server is healthy."""
         try:
-            response = requests.get(f"{self.server_url}/health", timeout=5)
+            response = self._session.get(self._health_url, timeout=5)
             response.raise_for_status()
-            return response.json()
+            health = response.json()
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
 
+        if health.get("status") == "healthy":
+            self._last_healthy_at = time.monotonic()
+        return health
+
     def is_available(self) -> bool:
-        """Check if server is available."""
+        """Check if server is available (skips the request if recently healthy)."""
+        if (
+            self._last_healthy_at is not None
+            and time.monotonic() - self._last_healthy_at < self.HEALTH_TTL
+        ):
+            return True
         health = self.health_check()
         return health.get("status") == "healthy"
 
@@ -58,7 +128,8 @@ class OmniParserClient:
         image: Image.Image,
         box_threshold: float = 0.05,
         iou_threshold: float = 0.1,
-    ) -> Tuple[Image.Image, List[UIElement]]:
+        return_labeled_image: bool = False,
+    ) -> Tuple[Optional[Image.Image], List[UIElement]]:
         """
         Parse image via remote server.
 
@@ -66,42 +137,49 @@ class OmniParserClient:
             image: PIL Image to parse
             box_threshold: Confidence threshold for detection
             iou_threshold: IoU threshold for NMS
+            return_labeled_image: Whether to request the annotated image
+                (skips a server-side PNG encode and local decode when False)
 
         Returns:
-            Tuple of (labeled_image, list of UIElements)
+            Tuple of (labeled_image or None, list of UIElements)
         """
-        # Encode image
-        image_b64 = self._image_to_base64(image)
+        options = {
+            "box_threshold": box_threshold,
+            "iou_threshold": iou_threshold,
+            "use_paddleocr": self.use_paddleocr,
+            "return_labeled_image": return_labeled_image,
+            "labeled_image_format": self.labeled_image_format,
+        }
 
         # Make request
-        response = requests.post(
-            f"{self.server_url}/parse",
-            json={
-                "image": image_b64,
-                "box_threshold": box_threshold,
-                "iou_threshold": iou_threshold,
-                "use_paddleocr": self.use_paddleocr,
-                "return_labeled_image": True,
-            },
-            timeout=self.timeout,
-        )
+        if self.use_binary_upload:
+            mime = f"image/{self.image_format.lower()}"
+            response = self._session.post(
+                self._parse_upload_url,
+                files={"image": ("screenshot", self._image_to_bytes(image), mime)},
+                data=options,
+                timeout=self.timeout,
+            )
+        else:
+            response = self._session.post(
+                self._parse_url,
+                json={"image": self._image_to_base64(image), **options},
+                timeout=self.timeout,
+            )
         response.raise_for_status()
-        data = response.json()
+        self._last_healthy_at = time.monotonic()  # a served parse proves health
+        data = _json_loads(response.content)
 
-        # Decode labeled image
-        labeled_image = Image.open(io.BytesIO(base64.b64decode(data["labeled_image"])))
+        # Decode labeled image (only present when requested)
+        labeled_image = None
+        if data.get("labeled_image"):
+            labeled_image = Image.open(io.BytesIO(base64.b64decode(data["labeled_image"])))
 
         # Convert to UIElement list
-        ui_elements = []
-        for elem in data["elements"]:
-            ui_elem = UIElement(
-                index=elem["index"],
-                type=elem["type"],
-                content=elem["content"],
-                bbox=tuple(elem["bbox"]),
-                center=tuple(elem["center"]),
-                is_clickable=elem["is_clickable"],
-            )
-            ui_elements.append(ui_elem)
+        ui_elements = [
+            UIElement(index, type_, content, tuple(bbox), tuple(center), is_clickable)
+            for index, type_, content, bbox, center, is_clickable
+            in map(_ELEMENT_FIELDS, data["elements"])
+        ]
 
         return labeled_image, ui_elements
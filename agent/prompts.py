@@ -35,11 +35,11 @@ ACTIONS:
 - Task not feasible: `{{"action_type": "status", "goal_status": "infeasible"}}`
 
 MULTI-SCREEN:
-- You are currently operating on screen {{screen}} (0=primary).
+- You are currently operating on screen {screen} (0=primary).
 - All coordinates and element indexes are relative to this screen.
 - To operate on a different screen, add `"screen": <screen_index>` to the action.
   For example: `{{"action_type": "click", "x": 100, "y": 200, "screen": 1}}`
-- If "screen" is omitted, the current screen ({{screen}}) is used.
+- If "screen" is omitted, the current screen ({screen}) is used.
 
 GUIDELINES:
 - Pick the easiest way to complete a task
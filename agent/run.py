@@ -72,10 +72,13 @@ def run_agent(goal: str, omniparser_url: str, screen: int = 0):
         print("SUMMARY")
         print("="*60)
         for i, r in enumerate(results):
-            print(f"  {i+1}. {r.summary}")
+            print(f"  {i+1}. {r.wait_summary()}")
 
     except KeyboardInterrupt:
         print("\n\nInterrupted.")
+    finally:
+        agent.close()
+        llm.close()
 
 
 def test_omniparser(server_url: str, screen_idx: int = 0):
@@ -96,7 +99,7 @@ def test_omniparser(server_url: str, screen_idx: int = 0):
     img = screen.screenshot(screen=screen_idx)
     print(f"Screenshot: {img.size}")
 
-    labeled_img, elements = client.parse(img)
+    labeled_img, elements = client.parse(img, return_labeled_image=True)
     print(f"Found {len(elements)} elements:")
     for e in elements[:10]:
         content = e.content[:40] + "..." if len(e.content) > 40 else e.content
@@ -8,6 +8,10 @@ Run with: python -m pydesktop.demo
 import sys
 import time
 
+# The submodules only import their optional backends (mss, pynput, Pillow)
+# inside try/except, so this succeeds even when main() reports them missing
+from pydesktop import screen, mouse, keyboard
+
 
 def demo_screen():
     """Demonstrate screen operations."""
@@ -15,8 +19,6 @@ def demo_screen():
     print("SCREEN OPERATIONS DEMO")
     print("=" * 50)
 
-    from pydesktop import screen
-
     # Get primary screen size
     width, height = screen.get_screen_size()
     print(f"\nPrimary screen size: {width}x{height}")
@@ -49,8 +51,6 @@ def demo_multiscreen():
     print("MULTI-SCREEN DEMO")
     print("=" * 50)
 
-    from pydesktop import screen, mouse
-
     screens = screen.get_all_screens()
     if len(screens) < 2:
         print("\nOnly 1 monitor detected, skipping multi-screen demo.")
@@ -62,14 +62,6 @@ def demo_multiscreen():
         offset = screen.get_screen_offset(s.id)
         print(f"  Screen {s.id}: {s.width}x{s.height}, offset={offset}, primary={s.is_primary}")
 
-    # Screenshot each screen
-    for s in screens:
-        print(f"\nScreenshot of screen {s.id}...")
-        img = screen.screenshot(screen=s.id)
-        filename = f"/tmp/pydesktop_demo_screen{s.id}.png"
-        img.save(filename)
-        print(f"  Saved to: {filename} ({img.width}x{img.height})")
-
     # Screenshot all monitors combined
     print("\nScreenshot of all monitors combined (screen=None)...")
     img_all = screen.screenshot(screen=None)
@@ -77,6 +69,17 @@ def demo_multiscreen():
     img_all.save(filename_all)
     print(f"  Saved to: {filename_all} ({img_all.width}x{img_all.height})")
 
+    # Crop each screen out of the combined capture (one grab instead of one
+    # per monitor); the combined image starts at the virtual screen origin
+    vx, vy, _, _ = screen.get_virtual_screen_size()
+    for s in screens:
+        print(f"\nScreenshot of screen {s.id}...")
+        left, top = s.x - vx, s.y - vy
+        img = img_all.crop((left, top, left + s.width, top + s.height))
+        filename = f"/tmp/pydesktop_demo_screen{s.id}.png"
+        img.save(filename)
+        print(f"  Saved to: {filename} ({img.width}x{img.height})")
+
     # Mouse position on different screens
     gx, gy = mouse.get_position(screen=None)
     print(f"\nMouse global position: ({gx}, {gy})")
@@ -103,8 +106,6 @@ def demo_mouse():
     print("MOUSE OPERATIONS DEMO")
     print("=" * 50)
 
-    from pydesktop import mouse, screen
-
     # Get current position (relative to primary screen)
     x, y = mouse.get_position()
     print(f"\nCurrent mouse position (screen 0): ({x}, {y})")
@@ -141,8 +142,6 @@ def demo_keyboard():
     print("KEYBOARD OPERATIONS DEMO")
     print("=" * 50)
 
-    from pydesktop import keyboard
-
     print("\nKeyboard module loaded successfully")
     print("\n[Note: Keyboard actions not demonstrated to avoid unwanted input]")
     print("  Available functions:")
@@ -161,27 +160,18 @@ def main():
     # Check dependencies
     print("\nChecking dependencies...")
 
+    # The backends were already imported with pydesktop; reuse its flags
     missing = []
-    try:
-        import mss
-        print("  mss installed")
-    except ImportError:
-        missing.append("mss")
-        print("  mss NOT installed")
-
-    try:
-        from pynput.mouse import Controller
-        print("  pynput installed")
-    except ImportError:
-        missing.append("pynput")
-        print("  pynput NOT installed")
-
-    try:
-        from PIL import Image
-        print("  Pillow installed")
-    except ImportError:
-        missing.append("Pillow")
-        print("  Pillow NOT installed")
+    for package, available in (
+        ("mss", screen.HAS_MSS),
+        ("pynput", mouse.HAS_PYNPUT),
+        ("Pillow", screen.HAS_PIL),
+    ):
+        if available:
+            print(f"  {package} installed")
+        else:
+            missing.append(package)
+            print(f"  {package} NOT installed")
 
     if missing:
         print(f"\nMissing dependencies: {', '.join(missing)}")
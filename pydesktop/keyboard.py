@@ -4,8 +4,11 @@ Keyboard control: key press, type text, key combinations.
 Uses `pynput` for cross-platform keyboard control.
 """
 
+import sys
+import threading
 import time
-from typing import Union, List, Tuple
+from functools import lru_cache
+from typing import Tuple, Union
 
 try:
     from pynput.keyboard import Key, Controller as KeyboardController, KeyCode
@@ -15,6 +18,9 @@ except ImportError:
 
 from .common import CURRENT_PLATFORM, Platform
 
+# A key name, or a pynput Key/KeyCode from parse()
+KeyLike = Union[str, "Key", "KeyCode"]
+
 
 def _ensure_pynput():
     """Ensure pynput is available."""
@@ -25,109 +31,126 @@ def _ensure_pynput():
         )
 
 
+_controller = None
+_controller_lock = threading.Lock()
+
+
 def _get_controller() -> "KeyboardController":
-    """Get keyboard controller instance."""
+    """Get the shared keyboard controller, creating it on first use."""
+    controller = _controller
+    if controller is None:
+        controller = _init_controller()
+    return controller
+
+
+def _init_controller() -> "KeyboardController":
+    """Create the shared keyboard controller (opens the display connection once)."""
+    global _controller
     _ensure_pynput()
-    return KeyboardController()
+    with _controller_lock:
+        if _controller is None:
+            _controller = KeyboardController()
+        return _controller
 
 
 # Map common key names to pynput Keys
 # Built dynamically to handle platform-specific keys that may not exist
 _KEY_MAP = {}
 
+# (space-separated aliases, pynput Key attribute); attributes missing on the
+# current platform (e.g. num_lock, insert on macOS) are skipped
+_KEY_SPEC = (
+    # Modifier keys
+    ("ctrl control", "ctrl"),
+    ("alt", "alt"),
+    ("shift", "shift"),
+    ("meta win windows cmd command super", "cmd"),
+    # Special keys
+    ("enter return", "enter"),
+    ("tab", "tab"),
+    ("space", "space"),
+    ("backspace", "backspace"),
+    ("delete del", "delete"),
+    ("escape esc", "esc"),
+    # Navigation
+    ("up", "up"),
+    ("down", "down"),
+    ("left", "left"),
+    ("right", "right"),
+    ("home", "home"),
+    ("end", "end"),
+    ("pageup page_up", "page_up"),
+    ("pagedown page_down", "page_down"),
+    # Lock keys
+    ("capslock caps_lock", "caps_lock"),
+    ("numlock num_lock", "num_lock"),
+    ("scrolllock scroll_lock", "scroll_lock"),
+    # Other platform-specific keys
+    ("insert", "insert"),
+    ("printscreen print_screen", "print_screen"),
+    ("pause", "pause"),
+    ("menu", "menu"),
+)
+
 
 def _build_key_map():
     """Build the key map, safely handling platform-specific keys."""
     if not HAS_PYNPUT:
         return
-    
-    # Modifier keys
-    _KEY_MAP["ctrl"] = Key.ctrl
-    _KEY_MAP["control"] = Key.ctrl
-    _KEY_MAP["alt"] = Key.alt
-    _KEY_MAP["shift"] = Key.shift
-    _KEY_MAP["meta"] = Key.cmd
-    _KEY_MAP["win"] = Key.cmd
-    _KEY_MAP["windows"] = Key.cmd
-    _KEY_MAP["cmd"] = Key.cmd
-    _KEY_MAP["command"] = Key.cmd
-    _KEY_MAP["super"] = Key.cmd
-    
-    # Function keys
-    for i in range(1, 13):
-        _KEY_MAP[f"f{i}"] = getattr(Key, f"f{i}")
-    
-    # Special keys
-    _KEY_MAP["enter"] = Key.enter
-    _KEY_MAP["return"] = Key.enter
-    _KEY_MAP["tab"] = Key.tab
-    _KEY_MAP["space"] = Key.space
-    _KEY_MAP["backspace"] = Key.backspace
-    _KEY_MAP["delete"] = Key.delete
-    _KEY_MAP["del"] = Key.delete
-    _KEY_MAP["escape"] = Key.esc
-    _KEY_MAP["esc"] = Key.esc
-    
-    # Navigation
-    _KEY_MAP["up"] = Key.up
-    _KEY_MAP["down"] = Key.down
-    _KEY_MAP["left"] = Key.left
-    _KEY_MAP["right"] = Key.right
-    _KEY_MAP["home"] = Key.home
-    _KEY_MAP["end"] = Key.end
-    _KEY_MAP["pageup"] = Key.page_up
-    _KEY_MAP["page_up"] = Key.page_up
-    _KEY_MAP["pagedown"] = Key.page_down
-    _KEY_MAP["page_down"] = Key.page_down
-    
-    # Lock keys - caps_lock exists on all platforms
-    _KEY_MAP["capslock"] = Key.caps_lock
-    _KEY_MAP["caps_lock"] = Key.caps_lock
-    
-    # Platform-specific keys - add only if they exist (some don't exist on macOS)
-    platform_specific_keys = [
-        ("numlock", "num_lock"),
-        ("num_lock", "num_lock"),
-        ("scrolllock", "scroll_lock"),
-        ("scroll_lock", "scroll_lock"),
-        ("insert", "insert"),
-        ("printscreen", "print_screen"),
-        ("print_screen", "print_screen"),
-        ("pause", "pause"),
-        ("menu", "menu"),
-    ]
-    for key_name, attr_name in platform_specific_keys:
+
+    # Keys are interned: split() and f-strings build fresh strings, while key
+    # names passed as literals (hotkey('ctrl', 'c')) are interned, so interned
+    # keys let lookups match by identity
+    for aliases, attr_name in _KEY_SPEC:
         if hasattr(Key, attr_name):
-            _KEY_MAP[key_name] = getattr(Key, attr_name)
+            names = map(sys.intern, aliases.split())
+            _KEY_MAP.update(dict.fromkeys(names, getattr(Key, attr_name)))
+
+    # Function keys
+    _KEY_MAP.update({sys.intern(f"f{i}"): getattr(Key, f"f{i}") for i in range(1, 13)})
+
 
+# Characters typed as named keys (matches pynput's Controller.type)
+_TYPE_CONTROL_CODES = {}
 
 # Initialize the key map
 if HAS_PYNPUT:
     _build_key_map()
+    _TYPE_CONTROL_CODES.update({"\n": Key.enter, "\r": Key.enter, "\t": Key.tab})
 
 
-def _parse_key(key: str) -> Union["Key", "KeyCode"]:
+def _parse_key_uncached(key: KeyLike) -> Union["Key", "KeyCode"]:
     """
     Parse a key string to a pynput key.
     
     Args:
-        key: Key name like 'a', 'enter', 'ctrl', etc.
+        key: Key name like 'a', 'enter', 'ctrl', etc., or an already
+             parsed pynput key (returned as-is).
     
     Returns:
         pynput Key or KeyCode object.
-    """
-    _ensure_pynput()
     
-    key_lower = key.lower()
+    Callers obtain the controller first, which raises ImportError when
+    pynput is missing, so no availability check is repeated here.
+    """
+    # Already parsed (e.g. a key from parse())
+    if not isinstance(key, str):
+        return key
     
-    # Check if it's a special key
-    if key_lower in _KEY_MAP:
-        return _KEY_MAP[key_lower]
+    # Check if it's a special key (names are usually already lowercase)
+    k = _KEY_MAP.get(key)
+    if k is not None:
+        return k
     
-    # Single character
+    # Single character (no key names are one character long)
     if len(key) == 1:
         return KeyCode.from_char(key)
     
+    # Special key given in another case, e.g. 'Enter'
+    k = _KEY_MAP.get(key.lower())
+    if k is not None:
+        return k
+    
     # Unknown key
     raise ValueError(
         f"Unknown key: '{key}'. Use single characters or special key names "
@@ -135,7 +158,35 @@ def _parse_key(key: str) -> Union["Key", "KeyCode"]:
     )
 
 
-def press(key: str):
+@lru_cache(maxsize=256)
+def _parse_key(key: KeyLike) -> Union["Key", "KeyCode"]:
+    """Cached _parse_key_uncached(); pynput keys are immutable and hashable."""
+    return _parse_key_uncached(key)
+
+
+def parse(key: str) -> Union["Key", "KeyCode"]:
+    """
+    Resolve a key name once, for reuse in loops.
+    
+    The result can be passed anywhere a key name is accepted (press,
+    key_down, key_up, hotkey) and skips name parsing on each call.
+    
+    Args:
+        key: Key name like 'a', 'enter', 'ctrl', etc.
+    
+    Returns:
+        pynput Key or KeyCode object.
+    
+    Example:
+        >>> f5 = parse('f5')
+        >>> for _ in range(10):
+        ...     press(f5)
+    """
+    _ensure_pynput()
+    return _parse_key(key)
+
+
+def press(key: KeyLike):
     """
     Press and release a key.
     
@@ -144,6 +195,7 @@ def press(key: str):
              - Single character: 'a', 'b', '1', '!'
              - Special key name: 'enter', 'tab', 'escape'
              - Modifier: 'ctrl', 'alt', 'shift', 'cmd'
+             - A key returned by parse()
     
     Example:
         >>> press('a')      # Press 'a'
@@ -156,7 +208,7 @@ def press(key: str):
     controller.release(k)
 
 
-def key_down(key: str):
+def key_down(key: KeyLike):
     """
     Press and hold a key (without releasing).
     
@@ -173,7 +225,7 @@ def key_down(key: str):
     controller.press(k)
 
 
-def key_up(key: str):
+def key_up(key: KeyLike):
     """
     Release a previously pressed key.
     
@@ -185,7 +237,7 @@ def key_up(key: str):
     controller.release(k)
 
 
-def hotkey(*keys: str):
+def hotkey(*keys: KeyLike):
     """
     Press a key combination (hotkey).
     
@@ -202,19 +254,32 @@ def hotkey(*keys: str):
     """
     controller = _get_controller()
     
-    # Parse all keys
-    parsed_keys = [_parse_key(k) for k in keys]
+    # Fast path for the common two-key combo (no list allocation)
+    if len(keys) == 2:
+        a, b = _parse_key(keys[0]), _parse_key(keys[1])
+        controller.press(a)
+        controller.press(b)
+        controller.release(b)
+        controller.release(a)
+        return
+    
+    _hotkey_parsed(controller, [_parse_key(k) for k in keys])
+
+
+def _hotkey_parsed(controller: "KeyboardController", parsed_keys):
+    """Press already-parsed keys in order, then release them in reverse."""
+    press, release = controller.press, controller.release
     
     # Press all keys
     for k in parsed_keys:
-        controller.press(k)
+        press(k)
     
     # Release all keys in reverse order
     for k in reversed(parsed_keys):
-        controller.release(k)
+        release(k)
 
 
-def press_combination(*keys: str):
+def press_combination(*keys: KeyLike):
     """
     Alias for hotkey(). Press a key combination.
     
@@ -239,9 +304,21 @@ def type_text(text: str, interval: float = 0.0):
     controller = _get_controller()
     
     if interval > 0:
-        for char in text:
-            controller.type(char)
-            time.sleep(interval)
+        # Resolve every keystroke up front, then run a tight press/release loop
+        control_codes = _TYPE_CONTROL_CODES
+        codes = [control_codes.get(c) or KeyCode.from_char(c) for c in text]
+        press, release = controller.press, controller.release
+        sleep, now = time.sleep, time.perf_counter
+        # Sleep to absolute deadlines so keystroke and sleep overhead doesn't
+        # accumulate into drift over long strings
+        deadline = now()
+        for k in codes:
+            deadline += interval
+            press(k)
+            release(k)
+            remaining = deadline - now()
+            if remaining > 0:
+                sleep(remaining)
     else:
         controller.type(text)
 
@@ -254,97 +331,85 @@ def write(text: str, interval: float = 0.0):
 
 
 # Common shortcuts
+# The platform is fixed at import, so each shortcut's keys are resolved once
+
+def _shortcut(mac_keys: Tuple[str, ...], other_keys: Tuple[str, ...]) -> tuple:
+    """Resolve a shortcut's keys for the current platform (empty without pynput)."""
+    if not HAS_PYNPUT:
+        return ()
+    keys = mac_keys if CURRENT_PLATFORM == Platform.MACOS else other_keys
+    return tuple(_parse_key(k) for k in keys)
+
+
+_COPY_KEYS = _shortcut(('cmd', 'c'), ('ctrl', 'c'))
+_PASTE_KEYS = _shortcut(('cmd', 'v'), ('ctrl', 'v'))
+_CUT_KEYS = _shortcut(('cmd', 'x'), ('ctrl', 'x'))
+_SELECT_ALL_KEYS = _shortcut(('cmd', 'a'), ('ctrl', 'a'))
+_UNDO_KEYS = _shortcut(('cmd', 'z'), ('ctrl', 'z'))
+_REDO_KEYS = _shortcut(('cmd', 'shift', 'z'), ('ctrl', 'y'))
+_SAVE_KEYS = _shortcut(('cmd', 's'), ('ctrl', 's'))
+_FIND_KEYS = _shortcut(('cmd', 'f'), ('ctrl', 'f'))
+_NEW_TAB_KEYS = _shortcut(('cmd', 't'), ('ctrl', 't'))
+_CLOSE_TAB_KEYS = _shortcut(('cmd', 'w'), ('ctrl', 'w'))
+_CLOSE_WINDOW_KEYS = _shortcut(('cmd', 'q'), ('alt', 'f4'))
+_SWITCH_WINDOW_KEYS = _shortcut(('cmd', 'tab'), ('alt', 'tab'))
+
+
 def copy():
     """Press Ctrl+C (Cmd+C on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'c')
-    else:
-        hotkey('ctrl', 'c')
+    _hotkey_parsed(_get_controller(), _COPY_KEYS)
 
 
 def paste():
     """Press Ctrl+V (Cmd+V on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'v')
-    else:
-        hotkey('ctrl', 'v')
+    _hotkey_parsed(_get_controller(), _PASTE_KEYS)
 
 
 def cut():
     """Press Ctrl+X (Cmd+X on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'x')
-    else:
-        hotkey('ctrl', 'x')
+    _hotkey_parsed(_get_controller(), _CUT_KEYS)
 
 
 def select_all():
     """Press Ctrl+A (Cmd+A on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'a')
-    else:
-        hotkey('ctrl', 'a')
+    _hotkey_parsed(_get_controller(), _SELECT_ALL_KEYS)
 
 
 def undo():
     """Press Ctrl+Z (Cmd+Z on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'z')
-    else:
-        hotkey('ctrl', 'z')
+    _hotkey_parsed(_get_controller(), _UNDO_KEYS)
 
 
 def redo():
     """Press Ctrl+Y (Cmd+Shift+Z on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'shift', 'z')
-    else:
-        hotkey('ctrl', 'y')
+    _hotkey_parsed(_get_controller(), _REDO_KEYS)
 
 
 def save():
     """Press Ctrl+S (Cmd+S on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 's')
-    else:
-        hotkey('ctrl', 's')
+    _hotkey_parsed(_get_controller(), _SAVE_KEYS)
 
 
 def find():
     """Press Ctrl+F (Cmd+F on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'f')
-    else:
-        hotkey('ctrl', 'f')
+    _hotkey_parsed(_get_controller(), _FIND_KEYS)
 
 
 def new_tab():
     """Press Ctrl+T (Cmd+T on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 't')
-    else:
-        hotkey('ctrl', 't')
+    _hotkey_parsed(_get_controller(), _NEW_TAB_KEYS)
 
 
 def close_tab():
     """Press Ctrl+W (Cmd+W on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'w')
-    else:
-        hotkey('ctrl', 'w')
+    _hotkey_parsed(_get_controller(), _CLOSE_TAB_KEYS)
 
 
 def close_window():
     """Press Alt+F4 (Cmd+Q on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'q')
-    else:
-        hotkey('alt', 'f4')
+    _hotkey_parsed(_get_controller(), _CLOSE_WINDOW_KEYS)
 
 
 def switch_window():
     """Press Alt+Tab (Cmd+Tab on macOS)."""
-    if CURRENT_PLATFORM == Platform.MACOS:
-        hotkey('cmd', 'tab')
-    else:
-        hotkey('alt', 'tab')
+    _hotkey_parsed(_get_controller(), _SWITCH_WINDOW_KEYS)
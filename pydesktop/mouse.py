@@ -4,21 +4,40 @@ Mouse control: click, move, drag, scroll.
 Uses `pynput` for cross-platform mouse control.
 """
 
+import threading
 import time
 from typing import Optional, Tuple, Literal
 
 try:
     from pynput.mouse import Button, Controller as MouseController
     HAS_PYNPUT = True
+    _BUTTONS = {
+        "left": Button.left,
+        "right": Button.right,
+        "middle": Button.middle,
+    }
 except ImportError:
     HAS_PYNPUT = False
+    _BUTTONS = {}
 
 from .common import Point, CURRENT_PLATFORM, Platform
+from .screen import get_screen_offset as _get_screen_offset
 
 
 # Button type hint
 ButtonType = Literal["left", "right", "middle"]
 
+# Easing type hint (progress curve for timed drags)
+EasingType = Literal["linear", "smoothstep", "cubic"]
+
+# Map progress t in [0, 1] to eased progress; the non-linear curves start and
+# end slowly, like a hand-guided drag
+_EASINGS = {
+    "linear": lambda t: t,
+    "smoothstep": lambda t: t * t * (3 - 2 * t),
+    "cubic": lambda t: 4 * t * t * t if t < 0.5 else 1 - (2 - 2 * t) ** 3 / 2,
+}
+
 
 def _ensure_pynput():
     """Ensure pynput is available."""
@@ -31,28 +50,39 @@ def _ensure_pynput():
 
 def _get_button(button: ButtonType) -> "Button":
     """Convert button name to pynput Button."""
-    buttons = {
-        "left": Button.left,
-        "right": Button.right,
-        "middle": Button.middle,
-    }
-    if button not in buttons:
+    btn = _BUTTONS.get(button)
+    if btn is None:
         raise ValueError(f"Unknown button: {button}. Use 'left', 'right', or 'middle'.")
-    return buttons[button]
+    return btn
+
+
+_controller = None
+_controller_lock = threading.Lock()
 
 
 def _get_controller() -> "MouseController":
-    """Get mouse controller instance."""
-    _ensure_pynput()
-    return MouseController()
+    """Get the shared mouse controller, creating it on first use."""
+    controller = _controller
+    if controller is None:
+        controller = _init_controller()
+    return controller
+
+
+def _init_controller() -> "MouseController":
+    """Create the shared mouse controller (opens the display connection once)."""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _ensure_pynput()
+            _controller = MouseController()
+        return _controller
 
 
 def _to_global(x: int, y: int, screen: Optional[int]) -> Tuple[int, int]:
     """Convert screen-local coordinates to global virtual screen coordinates."""
     if screen is None:
         return x, y
-    from . import screen as _screen
-    offset_x, offset_y = _screen.get_screen_offset(screen)
+    offset_x, offset_y = _get_screen_offset(screen)
     return x + offset_x, y + offset_y
 
 
@@ -60,11 +90,70 @@ def _from_global(gx: int, gy: int, screen: Optional[int]) -> Tuple[int, int]:
     """Convert global virtual screen coordinates to screen-local coordinates."""
     if screen is None:
         return gx, gy
-    from . import screen as _screen
-    offset_x, offset_y = _screen.get_screen_offset(screen)
+    offset_x, offset_y = _get_screen_offset(screen)
     return gx - offset_x, gy - offset_y
 
 
+# time.sleep can overshoot by 1-16 ms (coarse timers on Windows), so timed
+# moves sleep coarsely and then spin for the final stretch
+_SPIN_THRESHOLD = 0.002  # seconds before a deadline to stop sleeping and spin
+
+
+def _sleep_until(deadline: float):
+    """Sleep until a time.perf_counter() deadline with sub-millisecond accuracy."""
+    remaining = deadline - time.perf_counter()
+    if remaining > _SPIN_THRESHOLD:
+        time.sleep(remaining - _SPIN_THRESHOLD / 2)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _move_path(
+    controller: "MouseController",
+    start: Tuple[int, int],
+    target: Tuple[int, int],
+    duration: float,
+    steps: int,
+    easing: EasingType = "linear"
+):
+    """Move the cursor from start to target in steps spread over duration."""
+    ease = _EASINGS.get(easing)
+    if ease is None:
+        raise ValueError(
+            f"Unknown easing: {easing}. Use 'linear', 'smoothstep', or 'cubic'."
+        )
+    if duration <= 0 or steps <= 1:
+        controller.position = target
+        return
+
+    # Frames are paced by absolute deadlines, and each position comes from the
+    # time actually elapsed, so a late frame catches up instead of stretching
+    # the drag; the drag always ends at target after duration seconds
+    start_x, start_y = start
+    dx = target[0] - start_x
+    dy = target[1] - start_y
+    frame_delay = duration / steps
+    last = start
+
+    # Bind the hot-loop callables once; calling the position property's
+    # setter directly skips the descriptor lookup on every frame
+    set_position = type(controller).position.fset
+    perf_counter = time.perf_counter
+    sleep_until = _sleep_until
+
+    t0 = perf_counter()
+    for i in range(1, steps + 1):
+        sleep_until(t0 + frame_delay * i)
+        t = min((perf_counter() - t0) / duration, 1.0)
+        k = ease(t)
+        pos = (int(start_x + dx * k), int(start_y + dy * k))
+        if pos != last:  # skip injecting a no-op move event
+            set_position(controller, pos)
+            last = pos
+        if t >= 1.0:
+            break
+
+
 def get_position(screen: Optional[int] = 0) -> Tuple[int, int]:
     """
     Get the current mouse cursor position.
@@ -231,7 +320,8 @@ def drag_to(
     button: ButtonType = "left",
     duration: float = 0.0,
     steps: int = 10,
-    screen: int = 0
+    screen: int = 0,
+    easing: EasingType = "smoothstep"
 ):
     """
     Drag from current position to target position.
@@ -243,6 +333,8 @@ def drag_to(
         duration: Time in seconds for the drag operation.
         steps: Number of intermediate steps for smooth movement.
         screen: Screen index for target coordinates (0=primary).
+        easing: Progress curve for timed drags ('linear', 'smoothstep',
+            or 'cubic'); the non-linear curves ease in and out.
 
     Example:
         >>> move_to(100, 100)
@@ -256,20 +348,7 @@ def drag_to(
     start_x, start_y = int(start_x), int(start_y)
 
     controller.press(btn)
-
-    if duration > 0 and steps > 1:
-        step_delay = duration / steps
-        dx = (gx - start_x) / steps
-        dy = (gy - start_y) / steps
-
-        for i in range(1, steps + 1):
-            new_x = int(start_x + dx * i)
-            new_y = int(start_y + dy * i)
-            controller.position = (new_x, new_y)
-            time.sleep(step_delay)
-    else:
-        controller.position = (gx, gy)
-
+    _move_path(controller, (start_x, start_y), (gx, gy), duration, steps, easing)
     controller.release(btn)
 
 
@@ -278,7 +357,8 @@ def drag_relative(
     dy: int,
     button: ButtonType = "left",
     duration: float = 0.0,
-    steps: int = 10
+    steps: int = 10,
+    easing: EasingType = "smoothstep"
 ):
     """
     Drag from current position by a relative amount.
@@ -289,6 +369,8 @@ def drag_relative(
         button: Which button to use.
         duration: Time in seconds for the drag.
         steps: Number of intermediate steps.
+        easing: Progress curve for timed drags ('linear', 'smoothstep',
+            or 'cubic').
 
     Example:
         >>> drag_relative(100, 50)  # Drag 100 right and 50 down
@@ -301,20 +383,9 @@ def drag_relative(
     target_x, target_y = start_x + dx, start_y + dy
 
     controller.press(btn)
-
-    if duration > 0 and steps > 1:
-        step_delay = duration / steps
-        step_dx = dx / steps
-        step_dy = dy / steps
-
-        for i in range(1, steps + 1):
-            new_x = int(start_x + step_dx * i)
-            new_y = int(start_y + step_dy * i)
-            controller.position = (new_x, new_y)
-            time.sleep(step_delay)
-    else:
-        controller.position = (target_x, target_y)
-
+    _move_path(
+        controller, (start_x, start_y), (target_x, target_y), duration, steps, easing
+    )
     controller.release(btn)
 
 
@@ -330,6 +401,9 @@ def scroll(dx: int = 0, dy: int = 0):
         >>> scroll(dy=-3)  # Scroll up 3 "clicks"
         >>> scroll(dy=3)   # Scroll down 3 "clicks"
     """
+    if dx == 0 and dy == 0:
+        return
+
     controller = _get_controller()
 
     if dy != 0:
@@ -339,6 +413,52 @@ def scroll(dx: int = 0, dy: int = 0):
         controller.scroll(dx, 0)
 
 
+def scroll_smooth(
+    dy: int,
+    duration: float = 0.25,
+    steps: int = 15,
+    easing: EasingType = "smoothstep"
+):
+    """
+    Scroll vertically in small increments spread over time.
+
+    Many applications only start kinetic/smooth scrolling for a stream of
+    small wheel events, not for one large jump.
+
+    Args:
+        dy: Total vertical scroll, with the same sign convention as scroll().
+        duration: Time in seconds to spread the scroll over.
+        steps: Number of frames to spread the scroll over.
+        easing: Progress curve ('linear', 'smoothstep', or 'cubic').
+
+    Example:
+        >>> scroll_smooth(-10)  # Scroll 10 "clicks" over a quarter second
+    """
+    ease = _EASINGS.get(easing)
+    if ease is None:
+        raise ValueError(
+            f"Unknown easing: {easing}. Use 'linear', 'smoothstep', or 'cubic'."
+        )
+    if dy == 0:
+        return
+
+    controller = _get_controller()
+    if duration <= 0 or steps <= 1:
+        controller.scroll(0, dy)
+        return
+
+    # Emit the change in eased cumulative ticks each frame (whole ticks only)
+    frame_delay = duration / steps
+    done = 0
+    t0 = time.perf_counter()
+    for i in range(1, steps + 1):
+        _sleep_until(t0 + frame_delay * i)
+        total = round(dy * ease(i / steps))
+        if total != done:
+            controller.scroll(0, total - done)
+            done = total
+
+
 def scroll_up(amount: int = 3):
     """
     Scroll up.
@@ -4,6 +4,9 @@ Screen operations: resolution, screenshots, display info.
 Uses `mss` for cross-platform screen capture.
 """
 
+import threading
+import weakref
+from functools import lru_cache
 from typing import Optional, Tuple, List, Union
 from io import BytesIO
 
@@ -20,6 +23,12 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from .common import ScreenInfo, Rect
 
 
@@ -41,6 +50,66 @@ def _ensure_pil():
         )
 
 
+def _ensure_numpy():
+    """Ensure numpy is available."""
+    if not HAS_NUMPY:
+        raise ImportError(
+            "numpy is required for screenshot_to_numpy(). "
+            "Install it with: pip install pydesktop[numpy]"
+        )
+
+
+# One persistent mss instance per thread: opening a new one per call
+# reconnects to the display server, and mss handles are not thread-safe.
+# Each instance also caches the monitor list; bumping _generation makes every
+# thread open a fresh instance (and re-query monitors) on its next call.
+# Instances are closed by release_thread_resources(), or as a fallback when
+# the owning thread object is garbage collected.
+_local = threading.local()
+_generation = 0
+
+
+def _get_sct():
+    """Get the calling thread's persistent mss instance."""
+    sct = getattr(_local, "sct", None)
+    if sct is None or _local.generation != _generation:
+        _ensure_mss()
+        release_thread_resources()  # Close the stale instance, if any
+        sct = _local.sct = mss.mss()
+        _local.generation = _generation
+        _local.finalizer = weakref.finalize(threading.current_thread(), sct.close)
+    return sct
+
+
+def release_thread_resources():
+    """
+    Close the calling thread's screen capture handle.
+
+    Call at the end of a worker thread that took screenshots; the handle
+    holds a display server connection (X11) or device contexts (Windows).
+    The next screen operation in the thread opens a new one.
+    """
+    finalizer = getattr(_local, "finalizer", None)
+    if finalizer is not None:
+        finalizer()  # Closes the instance (only once)
+        _local.sct = _local.finalizer = None
+
+
+def invalidate_screens():
+    """
+    Forget cached display information.
+
+    Call after monitors are connected, disconnected or rearranged; the next
+    screen operation in each thread re-queries the monitor layout. The
+    calling thread's capture handle is closed right away, other threads
+    close theirs on their next screen operation.
+    """
+    global _generation
+    _generation += 1
+    _monitor_geometry.cache_clear()
+    release_thread_resources()
+
+
 def _get_monitor(screen: Optional[int], sct) -> dict:
     """
     Get mss monitor dict for a screen index.
@@ -62,6 +131,14 @@ def _get_monitor(screen: Optional[int], sct) -> dict:
     return sct.monitors[mss_index]
 
 
+@lru_cache(maxsize=16)
+def _monitor_geometry(screen: Optional[int]) -> Tuple[int, int, int, int]:
+    """Cached (left, top, width, height) of a screen; see invalidate_screens()."""
+    _ensure_mss()
+    mon = _get_monitor(screen, _get_sct())
+    return (mon["left"], mon["top"], mon["width"], mon["height"])
+
+
 def get_screen_size(screen: int = 0) -> Tuple[int, int]:
     """
     Get the size of a screen.
@@ -77,10 +154,7 @@ def get_screen_size(screen: int = 0) -> Tuple[int, int]:
         >>> print(f"Primary: {width}x{height}")
         >>> w2, h2 = get_screen_size(1)  # Second monitor
     """
-    _ensure_mss()
-    with mss.mss() as sct:
-        mon = _get_monitor(screen, sct)
-        return (mon["width"], mon["height"])
+    return _monitor_geometry(screen)[2:]
 
 
 def get_screen_offset(screen: int = 0) -> Tuple[int, int]:
@@ -93,10 +167,7 @@ def get_screen_offset(screen: int = 0) -> Tuple[int, int]:
     Returns:
         Tuple of (x, y) offset in pixels.
     """
-    _ensure_mss()
-    with mss.mss() as sct:
-        mon = _get_monitor(screen, sct)
-        return (mon["left"], mon["top"])
+    return _monitor_geometry(screen)[:2]
 
 
 def get_all_screens() -> List[ScreenInfo]:
@@ -113,19 +184,19 @@ def get_all_screens() -> List[ScreenInfo]:
     """
     _ensure_mss()
     screens = []
-    with mss.mss() as sct:
-        # Skip monitor 0 (virtual screen containing all monitors)
-        for i, mon in enumerate(sct.monitors[1:]):
-            screen = ScreenInfo(
-                id=i,
-                x=mon["left"],
-                y=mon["top"],
-                width=mon["width"],
-                height=mon["height"],
-                is_primary=(i == 0),
-                name=f"Screen {i}"
-            )
-            screens.append(screen)
+    sct = _get_sct()
+    # Skip monitor 0 (virtual screen containing all monitors)
+    for i, mon in enumerate(sct.monitors[1:]):
+        screen = ScreenInfo(
+            id=i,
+            x=mon["left"],
+            y=mon["top"],
+            width=mon["width"],
+            height=mon["height"],
+            is_primary=(i == 0),
+            name=f"Screen {i}"
+        )
+        screens.append(screen)
     return screens
 
 
@@ -137,9 +208,9 @@ def get_virtual_screen_size() -> Tuple[int, int, int, int]:
         Tuple of (x, y, width, height) for the virtual screen.
     """
     _ensure_mss()
-    with mss.mss() as sct:
-        mon = sct.monitors[0]
-        return (mon["left"], mon["top"], mon["width"], mon["height"])
+    sct = _get_sct()
+    mon = sct.monitors[0]
+    return (mon["left"], mon["top"], mon["width"], mon["height"])
 
 
 def screenshot(
@@ -165,47 +236,118 @@ def screenshot(
     _ensure_mss()
     _ensure_pil()
 
-    with mss.mss() as sct:
-        if region is not None:
-            if isinstance(region, Rect):
-                region = region.as_tuple()
-
-            x, y, w, h = region
-            # Offset region to screen's global position
-            if screen is not None:
-                mon = _get_monitor(screen, sct)
-                x += mon["left"]
-                y += mon["top"]
-            monitor_dict = {
-                "left": x,
-                "top": y,
-                "width": w,
-                "height": h
-            }
-        else:
-            mon = _get_monitor(screen, sct)
-            monitor_dict = {
-                "left": mon["left"],
-                "top": mon["top"],
-                "width": mon["width"],
-                "height": mon["height"]
-            }
-
-        sct_img = sct.grab(monitor_dict)
-
-        img = Image.frombytes(
-            "RGB",
-            (sct_img.width, sct_img.height),
-            sct_img.rgb
-        )
+    sct = _get_sct()
+    return _grab_image(sct, _capture_area(region, screen, sct))
+
+
+def _capture_area(
+    region: Optional[Union[Tuple[int, int, int, int], Rect]],
+    screen: Optional[int],
+    sct
+) -> dict:
+    """Resolve a screen-local region (or whole screen) to an mss monitor dict."""
+    if region is None:
+        # mss only reads the monitor dict, so grab it as-is
+        return _get_monitor(screen, sct)
+
+    if isinstance(region, Rect):
+        region = region.as_tuple()
+
+    x, y, w, h = region
+    # Offset region to screen's global position
+    if screen is not None:
+        mon = _get_monitor(screen, sct)
+        x += mon["left"]
+        y += mon["top"]
+    return {
+        "left": x,
+        "top": y,
+        "width": w,
+        "height": h
+    }
+
+
+def _grab_image(sct, monitor_dict: dict) -> "Image.Image":
+    """Grab an area with mss and convert it to a PIL RGB image."""
+    sct_img = sct.grab(monitor_dict)
+
+    # Decode the raw BGRA buffer directly; sct_img.rgb would first build
+    # an intermediate RGB copy in Python
+    return Image.frombytes(
+        "RGB",
+        (sct_img.width, sct_img.height),
+        sct_img.bgra,
+        "raw",
+        "BGRX"
+    )
+
+
+def screenshot_to_numpy(
+    region: Optional[Union[Tuple[int, int, int, int], Rect]] = None,
+    screen: Optional[int] = 0
+) -> "np.ndarray":
+    """
+    Capture a screenshot as a numpy array, without going through PIL.
+
+    Args:
+        region: Optional region as (x, y, width, height) in screen-local coords.
+        screen: Screen index (0=primary, 1+=others, None=all monitors combined).
+
+    Returns:
+        Contiguous uint8 array of shape (height, width, 3), RGB order.
+    """
+    _ensure_mss()
+    _ensure_numpy()
+
+    sct = _get_sct()
+    sct_img = sct.grab(_capture_area(region, screen, sct))
+    bgra = np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(
+        sct_img.height, sct_img.width, 4
+    )
+    # BGRA -> RGB in a single copy
+    return np.ascontiguousarray(bgra[:, :, 2::-1])
+
+
+class RegionGrabber:
+    """
+    Repeatedly capture the same region.
+
+    The region is resolved to virtual screen coordinates once, so each
+    grab() goes straight to mss. Create a new grabber after calling
+    invalidate_screens() if the screen layout changed.
+
+    Example:
+        >>> grabber = RegionGrabber((100, 100, 400, 300))
+        >>> for _ in range(30):
+        ...     img = grabber.grab()
+    """
+
+    def __init__(
+        self,
+        region: Optional[Union[Tuple[int, int, int, int], Rect]] = None,
+        screen: Optional[int] = 0
+    ):
+        """
+        Initialize a region grabber.
+
+        Args:
+            region: Optional region as (x, y, width, height) in screen-local coords.
+            screen: Screen index (0=primary, 1+=others, None=all monitors combined).
+        """
+        _ensure_mss()
+        _ensure_pil()
+        self._area = dict(_capture_area(region, screen, _get_sct()))
 
-        return img
+    def grab(self) -> "Image.Image":
+        """Capture the region, returns PIL Image."""
+        return _grab_image(_get_sct(), self._area)
 
 
 def screenshot_to_bytes(
     region: Optional[Union[Tuple[int, int, int, int], Rect]] = None,
     screen: Optional[int] = 0,
-    format: str = "PNG"
+    format: str = "JPEG",
+    quality: int = 85
 ) -> bytes:
     """
     Capture a screenshot and return as bytes.
@@ -213,14 +355,27 @@ def screenshot_to_bytes(
     Args:
         region: Optional region as (x, y, width, height).
         screen: Screen index (0=primary, 1+=others, None=all monitors).
-        format: Image format (PNG, JPEG, etc.).
+        format: Image format (JPEG/JPG, PNG, WEBP, etc.), or "RAW" for
+            unencoded RGB pixel rows (no encoder; size is width * height * 3).
+            The default was PNG in earlier versions and is now JPEG, which is
+            several times faster to encode but lossy; pass format="PNG" when
+            the capture must be lossless.
+        quality: Encoder quality for lossy formats (JPEG, WEBP).
 
     Returns:
         Image data as bytes.
     """
     img = screenshot(region=region, screen=screen)
+    fmt = format.upper()
+    if fmt == "RAW":
+        return img.tobytes()
+    if fmt == "JPG":
+        fmt = "JPEG"  # PIL only registers the JPEG name for saving
     buffer = BytesIO()
-    img.save(buffer, format=format)
+    if fmt in ("JPEG", "WEBP"):
+        img.save(buffer, format=fmt, quality=quality)
+    else:
+        img.save(buffer, format=fmt)
     return buffer.getvalue()
 
 
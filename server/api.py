@@ -4,12 +4,27 @@ OmniParser Server API - FastAPI application.
 
 import base64
 import io
+import os
+import threading
 from typing import Optional
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+try:
+    import pybase64
+    _b64decode = pybase64.b64decode
+except ImportError:
+    _b64decode = base64.b64decode
+
+try:
+    import orjson  # noqa: F401 (needed by ORJSONResponse)
+    from fastapi.responses import ORJSONResponse as _ResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _ResponseClass
+
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from PIL import Image
 
 from .omniparser_service import OmniParserService
@@ -26,6 +41,7 @@ class ParseRequest(BaseModel):
     iou_threshold: float = 0.1
     use_paddleocr: bool = True
     return_labeled_image: bool = True
+    labeled_image_format: str = "PNG"  # "PNG", "JPEG" or "WEBP" (lossy, faster)
 
 
 class UIElementResponse(BaseModel):
@@ -33,11 +49,15 @@ class UIElementResponse(BaseModel):
     index: int
     type: str
     content: str
-    bbox: list  # [x, y, width, height]
-    center: list  # [x, y]
+    bbox: tuple[int, int, int, int]  # (x, y, width, height)
+    center: tuple[int, int]  # (x, y)
     is_clickable: bool
 
 
+# Validates a whole element list in one pydantic-core call
+_ELEMENTS_ADAPTER = TypeAdapter(list[UIElementResponse])
+
+
 class ParseResponse(BaseModel):
     """Response from parsing an image."""
     elements: list[UIElementResponse]
@@ -60,6 +80,10 @@ class HealthResponse(BaseModel):
 # Will be initialized in lifespan
 omniparser_service: Optional[OmniParserService] = None
 
+# Parsing runs in the threadpool (keeping the event loop free for health
+# checks and uploads); the models are not safe to run concurrently
+_parse_lock = threading.Lock()
+
 
 # ============================================================================
 # Lifespan Management
@@ -70,10 +94,19 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan."""
     global omniparser_service
 
-    # Startup: Load models
+    # Startup: Load models (worker processes get their settings from the
+    # environment, see run_server)
     if omniparser_service is None:
-        omniparser_service = OmniParserService()
+        omniparser_service = OmniParserService(
+            omniparser_path=os.environ.get("OMNIPARSER_PATH") or None,
+            device=os.environ.get("OMNIPARSER_DEVICE", "cuda"),
+        )
     omniparser_service.load_models()
+    try:
+        omniparser_service.warmup()
+    except Exception as e:
+        # Only costs first-request latency, so never block startup on it
+        print(f"Warning: warm-up failed, continuing without it: {e}")
 
     yield
 
@@ -90,6 +123,7 @@ app = FastAPI(
     description="HTTP API for OmniParser screen parsing",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=_ResponseClass,
 )
 
 # CORS for cross-origin requests
@@ -116,6 +150,48 @@ async def health_check():
     )
 
 
+def _parse(
+    image_data: bytes,
+    box_threshold: float,
+    iou_threshold: float,
+    use_paddleocr: bool,
+    return_labeled_image: bool,
+    labeled_image_format: str = "PNG",
+) -> ParseResponse:
+    """Decode an encoded image, run the parser and build the response (blocking)."""
+    image = Image.open(io.BytesIO(image_data)).convert("RGB")
+
+    with _parse_lock:
+        labeled_png_b64, elements, parse_time = omniparser_service.parse(
+            image,
+            box_threshold=box_threshold,
+            iou_threshold=iou_threshold,
+            use_paddleocr=use_paddleocr,
+        )
+
+    # Encode labeled image if requested (PNG is passed through untouched)
+    labeled_image_b64 = None
+    if return_labeled_image:
+        labeled_image_format = labeled_image_format.upper()
+        if labeled_image_format in ("JPEG", "WEBP"):
+            labeled_image = Image.open(io.BytesIO(_b64decode(labeled_png_b64)))
+            buffer = io.BytesIO()
+            if labeled_image_format == "JPEG":
+                labeled_image.convert("RGB").save(buffer, format="JPEG", quality=90)
+            else:
+                labeled_image.save(buffer, format="WEBP", quality=90, method=4)
+            labeled_image_b64 = base64.b64encode(buffer.getbuffer()).decode("ascii")
+        else:
+            labeled_image_b64 = labeled_png_b64
+
+    return ParseResponse(
+        elements=_ELEMENTS_ADAPTER.validate_python(elements),
+        labeled_image=labeled_image_b64,
+        image_size=[image.width, image.height],
+        parse_time=parse_time,
+    )
+
+
 @app.post("/parse", response_model=ParseResponse)
 async def parse_image(request: ParseRequest):
     """Parse an image and return detected UI elements."""
@@ -124,29 +200,46 @@ async def parse_image(request: ParseRequest):
 
     try:
         # Decode base64 image
-        image_data = base64.b64decode(request.image)
-        image = Image.open(io.BytesIO(image_data)).convert("RGB")
+        image_data = _b64decode(request.image)
 
-        # Parse
-        labeled_image, elements, parse_time = omniparser_service.parse(
-            image,
+        return await run_in_threadpool(
+            _parse,
+            image_data,
             box_threshold=request.box_threshold,
             iou_threshold=request.iou_threshold,
             use_paddleocr=request.use_paddleocr,
+            return_labeled_image=request.return_labeled_image,
+            labeled_image_format=request.labeled_image_format,
         )
 
-        # Encode labeled image if requested
-        labeled_image_b64 = None
-        if request.return_labeled_image:
-            buffer = io.BytesIO()
-            labeled_image.save(buffer, format="PNG")
-            labeled_image_b64 = base64.b64encode(buffer.getvalue()).decode("utf-8")
-
-        return ParseResponse(
-            elements=[UIElementResponse(**e) for e in elements],
-            labeled_image=labeled_image_b64,
-            image_size=[image.width, image.height],
-            parse_time=parse_time,
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/parse_upload", response_model=ParseResponse)
+async def parse_upload(
+    image: UploadFile = File(...),
+    box_threshold: float = Form(0.05),
+    iou_threshold: float = Form(0.1),
+    use_paddleocr: bool = Form(True),
+    return_labeled_image: bool = Form(True),
+    labeled_image_format: str = Form("PNG"),
+):
+    """Parse an image uploaded as multipart/form-data (no base64 round-trip)."""
+    if not omniparser_service or not omniparser_service.is_loaded:
+        raise HTTPException(status_code=503, detail="Service not initialized")
+
+    try:
+        image_data = await image.read()
+
+        return await run_in_threadpool(
+            _parse,
+            image_data,
+            box_threshold=box_threshold,
+            iou_threshold=iou_threshold,
+            use_paddleocr=use_paddleocr,
+            return_labeled_image=return_labeled_image,
+            labeled_image_format=labeled_image_format,
         )
 
     except Exception as e:
@@ -162,15 +255,30 @@ def run_server(
     port: int = 8000,
     omniparser_path: Optional[str] = None,
     device: str = "cuda",
+    workers: int = 1,
 ):
-    """Run the OmniParser server."""
+    """
+    Run the OmniParser server.
+
+    uvicorn's default loop/http settings ("auto") use uvloop and httptools
+    when they are installed. With workers > 1 each worker process loads its
+    own copy of the models, which only pays off with spare GPUs or CPU OCR.
+    """
     import uvicorn
 
+    print(f"Starting OmniParser Server on {host}:{port}")
+
+    if workers > 1:
+        # Workers import the app themselves, so pass settings via environment
+        if omniparser_path:
+            os.environ["OMNIPARSER_PATH"] = omniparser_path
+        os.environ["OMNIPARSER_DEVICE"] = device
+        uvicorn.run("server.api:app", host=host, port=port, workers=workers)
+        return
+
     global omniparser_service
     omniparser_service = OmniParserService(
         omniparser_path=omniparser_path,
         device=device,
     )
-
-    print(f"Starting OmniParser Server on {host}:{port}")
     uvicorn.run(app, host=host, port=port)
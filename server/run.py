@@ -29,6 +29,12 @@ def main():
         help="Path to OmniParser directory (default: auto-detect)"
     )
     parser.add_argument("--device", default="cuda", help="Device to use (cuda/cpu)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes, each loading its own models (default: 1)"
+    )
     args = parser.parse_args()
 
     run_server(
@@ -36,6 +42,7 @@ def main():
         port=args.port,
         omniparser_path=args.omniparser_path,
         device=args.device,
+        workers=max(1, args.workers),
     )
 
 